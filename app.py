@@ -23,42 +23,186 @@ def get_date_range_data(_data_loader):
     max_date = orders['order_purchase_timestamp'].max()
     return min_date, max_date
 
+DASHBOARD_CSS = (
+    "<style>"
+    ".main>div{padding-top:2rem;}"
+    ".stSelectbox>div>div{background-color:white;}"
+    "</style>"
+)
+
+# Shared card markup; the footer line carries the trend, stars or an N/A note
+CARD_TMPL = (
+    "<div style=\"background-color:white;padding:20px;border-radius:10px;"
+    "box-shadow:0 2px 4px rgba(0,0,0,0.1);text-align:center;height:120px;"
+    "display:flex;flex-direction:column;justify-content:space-between;\">"
+    "<h4 style=\"margin:0;color:#666;font-size:14px;\">{title}</h4>"
+    "<h2 style=\"margin:10px 0;color:#333;font-size:24px;\">{value}</h2>"
+    "<div style=\"color:{footer_color};font-size:{footer_size};\">{footer}</div>"
+    "</div>"
+)
+
+# Static chart layouts, built once and shared by every rerun
+REVENUE_LAYOUT = dict(
+    title="Revenue Trend",
+    xaxis_title="Month",
+    yaxis_title="Revenue",
+    showlegend=True,
+    height=400,
+    xaxis=dict(showgrid=True, gridcolor='lightgray'),
+    yaxis=dict(
+        showgrid=True,
+        gridcolor='lightgray',
+        tickformat='.0s'
+    )
+)
+
+CATEGORY_LAYOUT = dict(
+    title="Top 10 Categories",
+    xaxis_title="Revenue",
+    yaxis_title="Category",
+    height=400,
+    xaxis=dict(tickformat='.0s')
+)
+
+STATE_LAYOUT = dict(
+    title="Revenue by State",
+    geo_scope='usa',
+    height=400
+)
+
+SATISFACTION_LAYOUT = dict(
+    title="Satisfaction vs Delivery Time",
+    xaxis_title="Delivery Time",
+    yaxis_title="Average Review Score",
+    height=400,
+    yaxis=dict(range=[0, 5])
+)
+
+SATISFACTION_EMPTY_LAYOUT = dict(
+    title="Satisfaction vs Delivery Time",
+    xaxis_title="Delivery Time",
+    yaxis_title="Average Review Score",
+    height=400,
+    showlegend=False
+)
+
+DELIVERY_BUCKET_EDGES = [1, 4, 8, 15]
+DELIVERY_BUCKET_LABELS = ['1-3 days', '4-7 days', '8-14 days', '15+ days']
+
+def month_key(ts):
+    # Integer month key (year * 12 + month - 1) so monthly groupbys skip Period objects
+    return ts.dt.year.values.astype(np.int32) * 12 + ts.dt.month.values.astype(np.int32) - 1
+
 @st.cache_data
-def filter_data_by_date(_data_loader, start_date, end_date):
+def build_sales_master(_data_loader):
     orders = _data_loader.orders
-    filtered_orders = orders[
-        (orders['order_purchase_timestamp'] >= start_date) & 
-        (orders['order_purchase_timestamp'] <= end_date)
-    ]
+    orders_master = orders[orders['order_purchase_timestamp'].notna()].sort_values(
+        'order_purchase_timestamp', kind='stable'
+    ).reset_index(drop=True)
     
     # Get delivered orders with all required date fields
-    delivered_orders = filtered_orders[
-        (filtered_orders['order_status'] == 'delivered') &
-        (filtered_orders['order_delivered_customer_date'].notna())
-    ].copy()
+    delivered_orders = orders_master[
+        (orders_master['order_status'] == 'delivered') &
+        (orders_master['order_delivered_customer_date'].notna())
+    ]
+    
+    # Join everything once; date filters then only slice this frame. Reviews stay in
+    # their own narrow frame and are attached only for the charts that use them.
+    # Dimension tables are indexed on their keys so each step is a single key lookup
+    orders_idx = delivered_orders[
+        ['order_id', 'customer_id', 'order_status', 'order_purchase_timestamp', 'delivery_days']
+    ].set_index('order_id')
+    products_idx = _data_loader.products.set_index('product_id')
+    customers_idx = _data_loader.customers.set_index('customer_id')
+    
+    sales_master = (
+        _data_loader.order_items
+        .join(orders_idx, on='order_id', how='inner', validate='m:1')
+        .join(products_idx, on='product_id', how='left', validate='m:1')
+        .join(customers_idx, on='customer_id', how='left', validate='m:1')
+    )
+    
+    sales_master = sales_master.sort_values('order_purchase_timestamp', kind='stable').reset_index(drop=True)
     
-    # Calculate delivery days
-    delivered_orders['delivery_days'] = (
-        delivered_orders['order_delivered_customer_date'] - 
-        delivered_orders['order_purchase_timestamp']
-    ).dt.days
+    sales_master['ym'] = month_key(sales_master['order_purchase_timestamp'])
     
-    sales_data = _data_loader.order_items.merge(
-        delivered_orders[['order_id', 'customer_id', 'order_status', 'order_purchase_timestamp', 'delivery_days']],
-        on='order_id'
-    ).merge(_data_loader.products, on='product_id', how='left')
+    # Order counts come from the order-level table, so flag the orders that reach the sales master
+    orders_master['ym'] = month_key(orders_master['order_purchase_timestamp'])
+    orders_master['has_sales'] = orders_master['order_id'].isin(sales_master['order_id'])
     
-    sales_data = sales_data.merge(_data_loader.customers, on='customer_id', how='left')
-    sales_data = sales_data.merge(_data_loader.reviews, on='order_id', how='left')
+    # Low-cardinality string keys grouped on every render
+    for col in ['product_category_name', 'customer_state']:
+        sales_master[col] = sales_master[col].astype('category')
+    
+    # Narrow numeric dtypes for the bandwidth-bound reductions
+    sales_master['price'] = sales_master['price'].astype('float32')
+    sales_master['delivery_days'] = sales_master['delivery_days'].astype('Int16')
+    
+    # Satisfaction chart bucket per row: 0..3 for the labelled ranges, -1 when unknown or under a day
+    days = sales_master['delivery_days'].to_numpy(dtype='float64', na_value=np.nan)
+    sales_master['delivery_bucket'] = np.where(
+        np.isnan(days), -1, np.digitize(days, DELIVERY_BUCKET_EDGES) - 1
+    ).astype(np.int8)
+    
+    # Sorted epoch-nanosecond buffers for the date slicing in filter_data_by_date
+    sales_ts = sales_master['order_purchase_timestamp'].values.astype('datetime64[ns]').view('i8')
+    orders_ts = orders_master['order_purchase_timestamp'].values.astype('datetime64[ns]').view('i8')
+    
+    return sales_master, orders_master, sales_ts, orders_ts
+
+@st.cache_data
+def build_reviews_master(_data_loader):
+    # Cached on its own so a rerun loads just this narrow frame, not the sales/orders masters
+    return _data_loader.reviews[['order_id', 'review_score']].astype({'review_score': 'Int8'})
+
+def ym_to_timestamp(ym):
+    ym = np.asarray(ym)
+    return pd.to_datetime(dict(year=ym // 12, month=ym % 12 + 1, day=1))
+
+def _date_slice(ts_values, start_ns, end_ns):
+    # Inclusive [start, end] range on a sorted int64 buffer: two binary searches, no masks
+    lo = np.searchsorted(ts_values, start_ns, side='left')
+    hi = np.searchsorted(ts_values, end_ns, side='right')
+    return slice(lo, hi)
+
+@st.cache_data
+def filter_data_by_date(_data_loader, start_ns: int, end_ns: int):
+    # Bounds are epoch nanoseconds so the cache key hashes plain ints
+    sales_master, orders_master, sales_ts, orders_ts = build_sales_master(_data_loader)
+    
+    sales_data = sales_master.iloc[_date_slice(sales_ts, start_ns, end_ns)]
+    filtered_orders = orders_master.iloc[_date_slice(orders_ts, start_ns, end_ns)]
     
     return sales_data, filtered_orders
 
-def calculate_kpis(current_data, previous_data):
-    current_revenue = current_data['price'].sum()
-    previous_revenue = previous_data['price'].sum() if len(previous_data) > 0 else 0
+def with_reviews(data, reviews_master):
+    # Lazy review join over just the columns the experience charts read; not validated
+    # as m:1, since an order may carry several reviews (each one is kept, as in a plain merge)
+    return data[['order_id', 'ym', 'delivery_days', 'delivery_bucket']].merge(
+        reviews_master, on='order_id', how='left'
+    )
+
+def monthly_summary(data, orders):
+    # Monthly revenue and order counts in one frame; period totals derive from it.
+    # Orders are counted on the integer month key of the order table, avoiding a
+    # string nunique over order_id.
+    # Slices of the time-sorted master list months in ascending order without a sort
+    revenue = data.groupby('ym', observed=True, sort=False)['price'].sum()
+    order_counts = orders.loc[orders['has_sales'].values, 'ym'].value_counts()
+    return pd.DataFrame({
+        'revenue': revenue,
+        'orders': order_counts.reindex(revenue.index, fill_value=0)
+    })
+
+def calculate_kpis(current_data, previous_data, current_orders, previous_orders):
+    current_summary = monthly_summary(current_data, current_orders)
+    previous_summary = monthly_summary(previous_data, previous_orders)
     
-    current_orders = current_data['order_id'].nunique()
-    previous_orders = previous_data['order_id'].nunique() if len(previous_data) > 0 else 0
+    current_revenue = current_summary['revenue'].sum()
+    previous_revenue = previous_summary['revenue'].sum()
+    
+    current_orders = current_summary['orders'].sum()
+    previous_orders = previous_summary['orders'].sum()
     
     current_aov = current_revenue / current_orders if current_orders > 0 else 0
     previous_aov = previous_revenue / previous_orders if previous_orders > 0 else 0
@@ -67,11 +211,7 @@ def calculate_kpis(current_data, previous_data):
     aov_growth = ((current_aov - previous_aov) / previous_aov * 100) if previous_aov > 0 else 0
     orders_growth = ((current_orders - previous_orders) / previous_orders * 100) if previous_orders > 0 else 0
     
-    current_data['year_month'] = current_data['order_purchase_timestamp'].dt.to_period('M')
-    previous_data['year_month'] = previous_data['order_purchase_timestamp'].dt.to_period('M') if len(previous_data) > 0 else pd.Series([], dtype='period[M]')
-    
-    current_monthly = current_data.groupby('year_month')['price'].sum()
-    previous_monthly = previous_data.groupby('year_month')['price'].sum() if len(previous_data) > 0 else pd.Series([])
+    current_monthly = current_summary['revenue']
     
     if len(current_monthly) >= 2:
         latest_month = current_monthly.iloc[-1]
@@ -87,7 +227,9 @@ def calculate_kpis(current_data, previous_data):
         'avg_order_value': current_aov,
         'aov_growth': aov_growth,
         'total_orders': current_orders,
-        'orders_growth': orders_growth
+        'orders_growth': orders_growth,
+        'current_monthly': current_monthly,
+        'previous_monthly': previous_summary['revenue']
     }
 
 def format_currency(value):
@@ -98,6 +240,15 @@ def format_currency(value):
     else:
         return f"${value:.0f}"
 
+def vectorized_format_currency(values):
+    # Array form of format_currency: every branch is formatted up front, np.select picks per element
+    values = np.asarray(values, dtype='float64')
+    # printf-style formatting rounds exactly like the f-strings there (not half-to-even on np.round)
+    millions = np.char.add(np.char.add('$', np.char.mod('%.1f', values / 1_000_000)), 'M')
+    thousands = np.char.add(np.char.add('$', np.char.mod('%.0f', values / 1_000)), 'K')
+    units = np.char.add('$', np.char.mod('%.0f', values))
+    return np.select([values >= 1_000_000, values >= 1_000], [millions, thousands], default=units)
+
 def format_number(value):
     if value >= 1_000_000:
         return f"{value/1_000_000:.1f}M"
@@ -112,107 +263,86 @@ def create_kpi_card(title, value, growth, is_currency=True):
     else:
         formatted_value = format_number(value)
     
-    growth_color = "green" if growth >= 0 else "red"
-    arrow = "↗" if growth >= 0 else "↘"
-    
-    card_html = f"""
-    <div style="
-        background-color: white;
-        padding: 20px;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        text-align: center;
-        height: 120px;
-        display: flex;
-        flex-direction: column;
-        justify-content: space-between;
-    ">
-        <h4 style="margin: 0; color: #666; font-size: 14px;">{title}</h4>
-        <h2 style="margin: 10px 0; color: #333; font-size: 24px;">{formatted_value}</h2>
-        <div style="color: {growth_color}; font-size: 14px;">
-            {arrow} {growth:.2f}%
-        </div>
-    </div>
-    """
-    return card_html
-
-def create_revenue_trend_chart(current_data, previous_data):
-    current_data['year_month'] = current_data['order_purchase_timestamp'].dt.to_period('M')
-    current_monthly = current_data.groupby('year_month')['price'].sum().reset_index()
-    current_monthly['date'] = current_monthly['year_month'].dt.to_timestamp()
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=current_monthly['date'],
-        y=current_monthly['price'],
+    return trend_card(title, formatted_value, growth)
+
+def trend_card(title, value, trend):
+    return CARD_TMPL.format_map({
+        'title': title,
+        'value': value,
+        'footer_color': "green" if trend >= 0 else "red",
+        'footer_size': "14px",
+        'footer': f"{'↗' if trend >= 0 else '↘'} {trend:.2f}%"
+    })
+
+def na_card(title, note):
+    return CARD_TMPL.format_map({
+        'title': title,
+        'value': "N/A",
+        'footer_color': "#999",
+        'footer_size': "14px",
+        'footer': note
+    })
+
+def create_revenue_trend_chart(current_monthly, previous_monthly):
+    # Monthly revenue Series indexed by 'ym', as returned by calculate_kpis
+    traces = [go.Scatter(
+        x=ym_to_timestamp(current_monthly.index),
+        y=current_monthly.values,
         mode='lines',
         name='Current Period',
         line=dict(color='#1f77b4', width=2)
-    ))
-    
-    if len(previous_data) > 0:
-        previous_data['year_month'] = previous_data['order_purchase_timestamp'].dt.to_period('M')
-        previous_monthly = previous_data.groupby('year_month')['price'].sum().reset_index()
-        previous_monthly['date'] = previous_monthly['year_month'].dt.to_timestamp()
-        
-        if len(previous_monthly) > 0:
-            previous_monthly['date'] = previous_monthly['date'] + pd.DateOffset(years=1)
-            
-            fig.add_trace(go.Scatter(
-                x=previous_monthly['date'],
-                y=previous_monthly['price'],
-                mode='lines',
-                name='Previous Period',
-                line=dict(color='#ff7f0e', width=2, dash='dash')
-            ))
-    
-    fig.update_layout(
-        title="Revenue Trend",
-        xaxis_title="Month",
-        yaxis_title="Revenue",
-        showlegend=True,
-        height=400,
-        xaxis=dict(showgrid=True, gridcolor='lightgray'),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='lightgray',
-            tickformat='.0s'
-        )
-    )
-    
-    return fig
+    )]
+    
+    if len(previous_monthly) > 0:
+        traces.append(go.Scatter(
+            x=ym_to_timestamp(previous_monthly.index + 12),
+            y=previous_monthly.values,
+            mode='lines',
+            name='Previous Period',
+            line=dict(color='#ff7f0e', width=2, dash='dash')
+        ))
+    
+    return go.Figure(data=traces, layout=REVENUE_LAYOUT)
 
 def create_category_chart(data):
-    category_revenue = data.groupby('product_category_name')['price'].sum().sort_values(ascending=False).head(10)
+    category_revenue = data.groupby('product_category_name', observed=True, sort=False)['price'].sum().nlargest(10)
     
     colors = px.colors.sequential.Blues_r[:len(category_revenue)]
     
     fig = go.Figure(data=[
         go.Bar(
-            y=[cat.replace('_', ' ').title() for cat in category_revenue.index],
+            # .str on a CategoricalIndex formats each distinct category once
+            y=category_revenue.index.str.replace('_', ' ').str.title(),
             x=category_revenue.values,
             orientation='h',
             marker_color=colors,
-            text=[format_currency(val) for val in category_revenue.values],
+            text=vectorized_format_currency(category_revenue.values),
             textposition='outside'
         )
-    ])
-    
-    fig.update_layout(
-        title="Top 10 Categories",
-        xaxis_title="Revenue",
-        yaxis_title="Category",
-        height=400,
-        xaxis=dict(tickformat='.0s')
-    )
+    ], layout=CATEGORY_LAYOUT)
     
     return fig
 
+def sum_by_code(codes, values, n_groups):
+    # Per-group sum over small integer codes (-1 = missing) in a single C loop
+    valid = codes >= 0
+    sums = np.bincount(codes[valid], weights=values[valid], minlength=n_groups)
+    counts = np.bincount(codes[valid], minlength=n_groups)
+    return sums, counts
+
 def create_state_map(data):
-    state_revenue = data.groupby('customer_state')['price'].sum().reset_index()
-    state_revenue['hover_text'] = state_revenue.apply(
-        lambda row: f"{row['customer_state']}<br>Revenue: {format_currency(row['price'])}", axis=1
+    states = data['customer_state'].cat.categories
+    state_sums, state_counts = sum_by_code(
+        data['customer_state'].cat.codes.values, data['price'].values, len(states)
+    )
+    observed = state_counts > 0
+    state_revenue = pd.DataFrame({
+        'customer_state': states[observed],
+        'price': state_sums[observed]
+    })
+    state_revenue['hover_text'] = np.char.add(
+        np.char.add(state_revenue['customer_state'].to_numpy(dtype=str), '<br>Revenue: '),
+        vectorized_format_currency(state_revenue['price'].values)
     )
     
     fig = go.Figure(data=go.Choropleth(
@@ -223,81 +353,53 @@ def create_state_map(data):
         text=state_revenue['hover_text'],
         hovertemplate='%{text}<extra></extra>',
         colorbar_title="Revenue"
-    ))
-    
-    fig.update_layout(
-        title="Revenue by State",
-        geo_scope='usa',
-        height=400
-    )
+    ), layout=STATE_LAYOUT)
     
     return fig
 
 def create_satisfaction_delivery_chart(data):
     # Check if we have the required columns
-    if 'review_score' not in data.columns or 'delivery_days' not in data.columns:
+    if 'review_score' not in data.columns or 'delivery_bucket' not in data.columns:
         # Create empty chart with message
-        fig = go.Figure()
+        fig = go.Figure(layout=SATISFACTION_EMPTY_LAYOUT)
         fig.add_annotation(
             text="No delivery or review data available for selected period",
             xref="paper", yref="paper",
             x=0.5, y=0.5, xanchor='center', yanchor='middle',
             showarrow=False, font=dict(size=16)
         )
-        fig.update_layout(
-            title="Satisfaction vs Delivery Time",
-            xaxis_title="Delivery Time",
-            yaxis_title="Average Review Score",
-            height=400,
-            showlegend=False
-        )
         return fig
     
-    data_with_reviews = data.dropna(subset=['review_score', 'delivery_days'])
+    bucket_codes = data['delivery_bucket'].values
+    scores = data['review_score'].to_numpy(dtype='float64', na_value=np.nan)
+    valid = (bucket_codes >= 0) & ~np.isnan(scores)
     
-    if len(data_with_reviews) == 0:
+    if not valid.any():
         # Create empty chart with message
-        fig = go.Figure()
+        fig = go.Figure(layout=SATISFACTION_EMPTY_LAYOUT)
         fig.add_annotation(
             text="No data available with both delivery and review information",
             xref="paper", yref="paper",
             x=0.5, y=0.5, xanchor='center', yanchor='middle',
             showarrow=False, font=dict(size=16)
         )
-        fig.update_layout(
-            title="Satisfaction vs Delivery Time",
-            xaxis_title="Delivery Time",
-            yaxis_title="Average Review Score",
-            height=400,
-            showlegend=False
-        )
         return fig
     
-    data_with_reviews['delivery_bucket'] = pd.cut(
-        data_with_reviews['delivery_days'],
-        bins=[0, 3, 7, 14, float('inf')],
-        labels=['1-3 days', '4-7 days', '8-14 days', '15+ days']
+    score_sums, score_counts = sum_by_code(
+        np.where(valid, bucket_codes, -1), scores, len(DELIVERY_BUCKET_LABELS)
     )
-    
-    satisfaction_by_delivery = data_with_reviews.groupby('delivery_bucket')['review_score'].mean().reset_index()
+    observed = score_counts > 0
+    mean_scores = score_sums[observed] / score_counts[observed]
     
     fig = go.Figure(data=[
         go.Bar(
-            x=satisfaction_by_delivery['delivery_bucket'],
-            y=satisfaction_by_delivery['review_score'],
+            x=np.array(DELIVERY_BUCKET_LABELS)[observed],
+            y=mean_scores,
             marker_color='#1f77b4',
-            text=[f"{score:.2f}" for score in satisfaction_by_delivery['review_score']],
+            text=np.char.mod("%.2f", mean_scores),
             textposition='outside'
         )
-    ])
-    
-    fig.update_layout(
-        title="Satisfaction vs Delivery Time",
-        xaxis_title="Delivery Time",
-        yaxis_title="Average Review Score",
-        height=400,
-        yaxis=dict(range=[0, 5])
-    )
+    ], layout=SATISFACTION_LAYOUT)
     
     return fig
 
@@ -308,120 +410,56 @@ def create_bottom_cards(data):
     
     # Handle delivery card
     if has_delivery:
-        data_with_delivery = data.dropna(subset=['delivery_days'])
-        avg_delivery = data_with_delivery['delivery_days'].mean()
+        # Work on the two needed columns rather than dropna copies of the whole frame
+        delivery_days = data['delivery_days'].to_numpy(dtype='float64', na_value=np.nan)
+        has_days = ~np.isnan(delivery_days)
+        delivery_days = delivery_days[has_days]
+        avg_delivery = delivery_days.mean()
         
-        if 'order_purchase_timestamp' in data_with_delivery.columns:
-            current_month_data = data_with_delivery[
-                data_with_delivery['order_purchase_timestamp'].dt.to_period('M') == 
-                data_with_delivery['order_purchase_timestamp'].dt.to_period('M').max()
-            ]
-            
-            prev_month_data = data_with_delivery[
-                data_with_delivery['order_purchase_timestamp'].dt.to_period('M') == 
-                (data_with_delivery['order_purchase_timestamp'].dt.to_period('M').max() - 1)
-            ]
-            
-            current_delivery = current_month_data['delivery_days'].mean() if len(current_month_data) > 0 else avg_delivery
-            prev_delivery = prev_month_data['delivery_days'].mean() if len(prev_month_data) > 0 else avg_delivery
+        if 'ym' in data.columns:
+            # Sums and counts for the latest two months of the selection in one bincount
+            # over each row's month offset; a month without rows falls back to the average
+            months_back = data['ym'].values[has_days]
+            months_back = months_back.max() - months_back
+            recent = months_back <= 1
+            counts = np.bincount(months_back[recent], minlength=2)
+            sums = np.bincount(months_back[recent], weights=delivery_days[recent], minlength=2)
+            current_delivery, prev_delivery = np.where(counts > 0, sums / np.maximum(counts, 1), avg_delivery)
             
             delivery_trend = ((prev_delivery - current_delivery) / prev_delivery * 100) if prev_delivery > 0 else 0
         else:
             delivery_trend = 0
         
-        delivery_card = f"""
-        <div style="
-            background-color: white;
-            padding: 20px;
-            border-radius: 10px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-            height: 120px;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        ">
-            <h4 style="margin: 0; color: #666; font-size: 14px;">Average Delivery Time</h4>
-            <h2 style="margin: 10px 0; color: #333; font-size: 24px;">{avg_delivery:.1f} days</h2>
-            <div style="color: {'green' if delivery_trend >= 0 else 'red'}; font-size: 14px;">
-                {'↗' if delivery_trend >= 0 else '↘'} {abs(delivery_trend):.2f}%
-            </div>
-        </div>
-        """
+        # Shorter deliveries are an improvement, so the arrow shows the magnitude only
+        delivery_card = CARD_TMPL.format_map({
+            'title': "Average Delivery Time",
+            'value': f"{avg_delivery:.1f} days",
+            'footer_color': 'green' if delivery_trend >= 0 else 'red',
+            'footer_size': "14px",
+            'footer': f"{'↗' if delivery_trend >= 0 else '↘'} {abs(delivery_trend):.2f}%"
+        })
     else:
-        delivery_card = f"""
-        <div style="
-            background-color: white;
-            padding: 20px;
-            border-radius: 10px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-            height: 120px;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        ">
-            <h4 style="margin: 0; color: #666; font-size: 14px;">Average Delivery Time</h4>
-            <h2 style="margin: 10px 0; color: #333; font-size: 24px;">N/A</h2>
-            <div style="color: #999; font-size: 14px;">No delivery data</div>
-        </div>
-        """
+        delivery_card = na_card("Average Delivery Time", "No delivery data")
     
     # Handle review card
     if has_reviews:
-        data_with_reviews = data.dropna(subset=['review_score'])
-        avg_review = data_with_reviews['review_score'].mean()
+        avg_review = data['review_score'].mean()
         stars = "★" * int(round(avg_review)) + "☆" * (5 - int(round(avg_review)))
         
-        review_card = f"""
-        <div style="
-            background-color: white;
-            padding: 20px;
-            border-radius: 10px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-            height: 120px;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        ">
-            <h4 style="margin: 0; color: #666; font-size: 14px;">Average Review Score</h4>
-            <h2 style="margin: 10px 0; color: #333; font-size: 24px;">{avg_review:.2f}</h2>
-            <div style="color: #ffd700; font-size: 18px;">{stars}</div>
-        </div>
-        """
+        review_card = CARD_TMPL.format_map({
+            'title': "Average Review Score",
+            'value': f"{avg_review:.2f}",
+            'footer_color': "#ffd700",
+            'footer_size': "18px",
+            'footer': stars
+        })
     else:
-        review_card = f"""
-        <div style="
-            background-color: white;
-            padding: 20px;
-            border-radius: 10px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-            height: 120px;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        ">
-            <h4 style="margin: 0; color: #666; font-size: 14px;">Average Review Score</h4>
-            <h2 style="margin: 10px 0; color: #333; font-size: 24px;">N/A</h2>
-            <div style="color: #999; font-size: 14px;">No review data</div>
-        </div>
-        """
+        review_card = na_card("Average Review Score", "No review data")
     
     return delivery_card, review_card
 
 def main():
-    st.markdown("""
-    <style>
-    .main > div {
-        padding-top: 2rem;
-    }
-    .stSelectbox > div > div {
-        background-color: white;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
     
     data_loader, datasets = load_data()
     min_date, max_date = get_date_range_data(data_loader)
@@ -455,15 +493,17 @@ def main():
         st.error("Start date must be before end date")
         return
     
-    current_data, current_orders = filter_data_by_date(data_loader, pd.Timestamp(start_date), pd.Timestamp(end_date))
+    current_data, current_orders = filter_data_by_date(
+        data_loader, pd.Timestamp(start_date).value, pd.Timestamp(end_date).value
+    )
     
     period_length = (pd.Timestamp(end_date) - pd.Timestamp(start_date)).days
     previous_start = pd.Timestamp(start_date) - pd.DateOffset(days=period_length)
     previous_end = pd.Timestamp(start_date) - pd.DateOffset(days=1)
     
-    previous_data, previous_orders = filter_data_by_date(data_loader, previous_start, previous_end)
+    previous_data, previous_orders = filter_data_by_date(data_loader, previous_start.value, previous_end.value)
     
-    kpis = calculate_kpis(current_data, previous_data)
+    kpis = calculate_kpis(current_data, previous_data, current_orders, previous_orders)
     
     st.markdown("### Key Performance Indicators")
     
@@ -486,7 +526,7 @@ def main():
     chart_col1, chart_col2 = st.columns(2)
     
     with chart_col1:
-        revenue_chart = create_revenue_trend_chart(current_data, previous_data)
+        revenue_chart = create_revenue_trend_chart(kpis['current_monthly'], kpis['previous_monthly'])
         st.plotly_chart(revenue_chart, use_container_width=True)
     
     with chart_col2:
@@ -495,19 +535,22 @@ def main():
     
     chart_col3, chart_col4 = st.columns(2)
     
+    reviews_master = build_reviews_master(data_loader)
+    current_reviews = with_reviews(current_data, reviews_master)
+    
     with chart_col3:
         state_map = create_state_map(current_data)
         st.plotly_chart(state_map, use_container_width=True)
     
     with chart_col4:
-        satisfaction_chart = create_satisfaction_delivery_chart(current_data)
+        satisfaction_chart = create_satisfaction_delivery_chart(current_reviews)
         st.plotly_chart(satisfaction_chart, use_container_width=True)
     
     st.markdown("### Customer Experience")
     
     bottom_col1, bottom_col2 = st.columns(2)
     
-    delivery_card, review_card = create_bottom_cards(current_data)
+    delivery_card, review_card = create_bottom_cards(current_reviews)
     
     with bottom_col1:
         st.markdown(delivery_card, unsafe_allow_html=True)
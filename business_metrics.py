@@ -4,55 +4,394 @@ Business Metrics Calculation Module for E-commerce Analysis
 This module contains functions for calculating key business metrics and KPIs.
 """
 
+import functools
+import weakref
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
-import plotly.express as px
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Any, Union
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
+from matplotlib.ticker import StrMethodFormatter
 import seaborn as sns
+from concurrent.futures import ThreadPoolExecutor
+
+if TYPE_CHECKING:
+    import dask.dataframe as dd
+
+try:
+    import numba  # noqa: F401 - only needed for pandas' engine='numba'
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Below this many rows numba's JIT compile cost outweighs the faster kernels
+NUMBA_MIN_ROWS = 1_000_000
+NUMBA_ENGINE_KWARGS = {'parallel': True, 'nogil': True}
+
+# Analysis inputs may be pandas or (out-of-core) Dask DataFrames
+Frame = Union[pd.DataFrame, 'dd.DataFrame']
+
+def _is_lazy(data) -> bool:
+    """
+    Check whether data is a lazy collection (e.g. Dask) rather than an in-memory pandas object.
+    
+    Args:
+        data: DataFrame, Series or scalar
+        
+    Returns:
+        bool: True if the object needs compute() to be materialized
+    """
+    return not isinstance(data, (pd.DataFrame, pd.Series)) and hasattr(data, 'compute')
+
+def _materialize(*results) -> Tuple:
+    """
+    Compute lazy results together so they share one scan of the source; pandas results pass through.
+    
+    Args:
+        *results: Aggregation results, pandas or lazy
+        
+    Returns:
+        Tuple: The materialized results, in order
+    """
+    if not any(_is_lazy(r) for r in results):
+        return results
+    import dask
+    return dask.compute(*results)
+
+def _engine_kwargs(data: Frame) -> Dict:
+    """
+    Pick the groupby engine for a reduction over data.
+    
+    Args:
+        data (Frame): Data being reduced
+        
+    Returns:
+        Dict: Keyword arguments for GroupBy.sum/mean (empty means the default Cython path)
+    """
+    # Dask groupbys have no engine argument, and len() would trigger a compute
+    if _HAS_NUMBA and not _is_lazy(data) and len(data) > NUMBA_MIN_ROWS:
+        return {'engine': 'numba', 'engine_kwargs': NUMBA_ENGINE_KWARGS}
+    return {}
+
+# Delivery speed buckets: (-inf, 3], (3, 7], (7, inf)
+DELIVERY_SPEED_EDGES = np.array([3, 7], dtype='float64')
+DELIVERY_SPEED_LABELS = ['1-3 days', '4-7 days', '8+ days']
+
+if _HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _bin_delivery_kernel(days, out):
+        for i in range(days.shape[0]):
+            d = days[i]
+            if np.isnan(d):
+                out[i] = -1
+            elif d <= 3:
+                out[i] = 0
+            elif d <= 7:
+                out[i] = 1
+            else:
+                out[i] = 2
+
+def _delivery_speed(days) -> pd.Categorical:
+    """
+    Bin delivery days into the fixed delivery speed categories.
+    
+    Args:
+        days: 1-D array-like of delivery days (NaN for undelivered)
+        
+    Returns:
+        pd.Categorical: Delivery speed labels, NaN where days is missing
+    """
+    days = np.asarray(days, dtype='float64')
+    codes = np.empty(days.shape, dtype='int8')
+    if _HAS_NUMBA:
+        _bin_delivery_kernel(days, codes)
+    else:
+        codes[:] = np.searchsorted(DELIVERY_SPEED_EDGES, days, side='left')
+        codes[np.isnan(days)] = -1
+    return pd.Categorical.from_codes(codes, categories=DELIVERY_SPEED_LABELS)
+
+def _pct_change(values) -> np.ndarray:
+    """
+    Percentage change between consecutive elements, NaN for the first.
+    
+    Args:
+        values: 1-D array-like of numbers
+        
+    Returns:
+        np.ndarray: Percentage changes (same length as input)
+    """
+    values = np.asarray(values, dtype='float64')
+    change = np.full(values.shape, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change[1:] = np.diff(values) / values[:-1] * 100
+    return change
+
+def _as_category(data: Frame, column: str) -> Frame:
+    """
+    Ensure a group key column is categorical so groupbys hash its integer codes.
+    
+    Args:
+        data (Frame): Input data
+        column (str): Name of the group key column
+        
+    Returns:
+        Frame: The input unchanged if already categorical (or lazy), else a shallow copy with the column cast
+    """
+    # Casting a Dask column yields unknown categories, which would cost an extra pass to resolve
+    if _is_lazy(data):
+        return data
+    col = data[column]
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return data
+    return data.assign(**{column: col.astype('category')})
+
+def _nunique_per_code(codes: np.ndarray, n_groups: int, values: pd.Series) -> np.ndarray:
+    """
+    Count distinct values per group using integer codes instead of hashing the raw values per group.
+    
+    Args:
+        codes (np.ndarray): Group codes in [0, n_groups), -1 for missing keys
+        n_groups (int): Number of groups
+        values (pd.Series): Values to count (e.g. customer IDs); missing values are ignored
+        
+    Returns:
+        np.ndarray: Distinct value count for each group code
+    """
+    # Categorical values already carry integer codes; anything else is factorized once
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        value_codes, n_values = values.cat.codes.to_numpy(), len(values.cat.categories)
+    else:
+        value_codes, uniques = pd.factorize(values, sort=False)
+        n_values = len(uniques)
+    valid = (codes >= 0) & (value_codes >= 0)
+    
+    # Each (group, value) pair packs into one int64; a hash-based dedupe (no sort) leaves
+    # one entry per distinct value, and its group is recovered from the packed pair
+    pairs = pd.unique(codes[valid].astype('int64') * max(n_values, 1) + value_codes[valid])
+    return np.bincount(pairs // max(n_values, 1), minlength=n_groups)
+
+def _top_k(series: pd.Series, k: int = 10) -> Dict:
+    """
+    Largest k values of a Series as a dict, materializing only those k entries.
+    
+    Matches Series.nlargest(k).to_dict(): descending order, ties kept in original order, NaN only
+    used to fill up to k entries.
+    
+    Args:
+        series (pd.Series): Values indexed by label
+        k (int): Number of entries to keep
+        
+    Returns:
+        Dict: Label -> value for the top k entries
+    """
+    values = series.to_numpy(dtype='float64', na_value=np.nan)
+    missing = np.isnan(values)
+    candidates = np.flatnonzero(~missing)
+    if candidates.size > k:
+        # Partition to the k-th largest, then keep everything tied with it so ordering stays stable
+        kth = np.partition(values[candidates], candidates.size - k)[candidates.size - k]
+        candidates = candidates[values[candidates] >= kth]
+    top = candidates[np.lexsort((candidates, -values[candidates]))][:k]
+    if top.size < k:
+        top = np.concatenate([top, np.flatnonzero(missing)[:k - top.size]])
+    return series.iloc[top].to_dict()
+
+@functools.lru_cache(maxsize=None)
+def _display_label(raw: str) -> str:
+    """
+    Human-readable form of a snake_case label, computed once per distinct value.
+    
+    Args:
+        raw (str): Raw label, e.g. 'home_garden'
+        
+    Returns:
+        str: Display label, e.g. 'Home Garden'
+    """
+    return raw.replace('_', ' ').title()
+
+def _frame_key(data) -> Optional[Tuple]:
+    """
+    Cheap identity/version key for a DataFrame argument.
+    
+    Args:
+        data: DataFrame or None
+        
+    Returns:
+        Tuple: (id, shape, first index label), or None for a missing argument
+    """
+    if data is None:
+        return None
+    return (id(data), data.shape, data.index[0] if len(data) else None)
+
+def _result_copy(result):
+    """
+    Copy of a cached metric result, so callers can modify it without touching the cache.
+    
+    Dicts are copied recursively and pandas objects deeply; both are small aggregates.
+    
+    Args:
+        result: Metric result (dict, DataFrame, Series or scalar)
+        
+    Returns:
+        A copy of result (immutable scalars are returned as is)
+    """
+    if isinstance(result, dict):
+        return {key: _result_copy(value) for key, value in result.items()}
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy()
+    return result
+
+def _memoized(method):
+    """
+    Cache a metric method's result on the instance, keyed on its DataFrame arguments.
+    
+    Entries are checked against weak references so a recycled id() never returns a stale
+    result, and are dropped once the input frame is garbage collected. Lazy (Dask) and
+    Arrow dataset inputs are never cached. Each call returns its own copy of the result.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        frames = args + tuple(kwargs.values())
+        if any(f is not None and not isinstance(f, pd.DataFrame) for f in frames):
+            return method(self, *args, **kwargs)
+        
+        key = (method.__name__, tuple(kwargs)) + tuple(_frame_key(f) for f in frames)
+        hit = self._cache.get(key)
+        if hit is not None and all(ref is None or ref() is f for ref, f in zip(hit[0], frames)):
+            return _result_copy(hit[1])
+        
+        result = method(self, *args, **kwargs)
+        evict = lambda _ref, key=key: self._cache.pop(key, None)
+        refs = tuple(None if f is None else weakref.ref(f, evict) for f in frames)
+        self._cache[key] = (refs, result)
+        return _result_copy(result)
+    return wrapper
 
 class EcommerceMetrics:
     """
     A class to calculate various e-commerce business metrics and generate visualizations.
+    
+    The calculate_*/analyze_* methods also accept Dask DataFrames; only the small
+    aggregated results are computed, so the raw sales data never has to fit in memory.
     """
     
-    def __init__(self, color_scheme: str = 'viridis'):
+    def __init__(self, color_scheme: str = 'viridis', arrow: bool = False):
         """
         Initialize the metrics calculator.
         
         Args:
             color_scheme (str): Color scheme for visualizations
+            arrow (bool): Run the revenue reductions on Arrow-backed price/ID columns
         """
         self.color_scheme = color_scheme
+        self.arrow = arrow
+        self._cache = {}
+    
+    def invalidate(self):
+        """
+        Clear cached metric results (call after modifying an input DataFrame in place).
+        """
+        self._cache.clear()
+    
+    def _to_arrow(self, data: Frame, columns: List[str]) -> Frame:
+        """
+        Convert the given hot columns to Arrow-backed dtypes when arrow mode is on.
+        
+        Args:
+            data (Frame): Input data
+            columns (List[str]): Columns the calling metric reduces or groups on
+            
+        Returns:
+            Frame: The input unchanged, or a shallow copy with those columns converted
+        """
+        if not self.arrow or _is_lazy(data):
+            return data
         
-    def calculate_revenue_metrics(self, sales_data: pd.DataFrame, 
-                                 comparison_data: Optional[pd.DataFrame] = None) -> Dict:
+        pending = [c for c in columns if c in data.columns and not isinstance(data[c].dtype, pd.ArrowDtype)]
+        if not pending:
+            return data
+        
+        # convert_integer=False keeps float prices as double[pyarrow] instead of narrowing them to ints
+        converted = data[pending].convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
+        return data.assign(**{c: converted[c] for c in pending})
+        
+    @_memoized
+    def _order_summary(self, sales_data: pd.DataFrame) -> pd.Series:
+        """
+        Per-order revenue keyed by (month, order_id), shared by the revenue and trend metrics.
+        
+        An order's items all carry its purchase month, so this holds one row per order. It is
+        memoized on the input frame, so running several metrics on the same data scans it once.
+        
+        Args:
+            sales_data (pd.DataFrame): In-memory sales data with month, order_id and price
+            
+        Returns:
+            pd.Series: Order totals with a (month, order_id) MultiIndex
+        """
+        sales_data = self._to_arrow(sales_data, ['order_id', 'price'])
+        # dropna=False keeps orders without a month in the revenue totals; rows without an order are dropped
+        order_totals = sales_data.groupby(['month', 'order_id'], sort=False, observed=True, dropna=False)['price'].sum(
+            **_engine_kwargs(sales_data)
+        )
+        return order_totals[order_totals.index.get_level_values('order_id').notna()]
+    
+    def _revenue_totals(self, sales_data: Union[Frame, ds.Dataset]) -> Tuple:
+        """
+        Total revenue, order count, average order value and item count for one period.
+        
+        Args:
+            sales_data (Frame or ds.Dataset): Sales data with order_id and price
+            
+        Returns:
+            Tuple: (total_revenue, total_orders, avg_order_value, total_items_sold)
+        """
+        if isinstance(sales_data, ds.Dataset):
+            # Read only the two needed columns and aggregate in Arrow without building a DataFrame
+            table = sales_data.to_table(columns=['order_id', 'price'])
+            grouped = table.group_by('order_id').aggregate([('price', 'sum')])
+            grouped = grouped.filter(pc.is_valid(grouped['order_id']))
+            order_totals = pc.fill_null(grouped['price_sum'], 0)
+            return pc.sum(order_totals).as_py(), len(order_totals), pc.mean(order_totals).as_py(), table.num_rows
+        
+        # Per-order totals feed revenue, order count and AOV from a single groupby
+        if not _is_lazy(sales_data) and 'month' in sales_data.columns:
+            order_totals, total_items = self._order_summary(sales_data), len(sales_data)
+        else:
+            sales_data = self._to_arrow(sales_data, ['order_id', 'price'])
+            # A lazy row count is computed in the same pass as the order totals
+            row_count = sales_data.map_partitions(len).sum() if _is_lazy(sales_data) else len(sales_data)
+            order_totals, total_items = _materialize(
+                sales_data.groupby('order_id', sort=False, observed=True)['price'].sum(), row_count
+            )
+        return order_totals.sum(), order_totals.size, order_totals.mean(), total_items
+    
+    @_memoized
+    def calculate_revenue_metrics(self, sales_data: Union[Frame, ds.Dataset], 
+                                 comparison_data: Optional[Union[Frame, ds.Dataset]] = None) -> Dict:
         """
         Calculate revenue-related metrics.
         
         Args:
-            sales_data (pd.DataFrame): Current period sales data
-            comparison_data (pd.DataFrame, optional): Previous period for comparison
+            sales_data (pd.DataFrame or ds.Dataset): Current period sales data
+            comparison_data (pd.DataFrame or ds.Dataset, optional): Previous period for comparison
             
         Returns:
             Dict: Revenue metrics including total revenue, growth rate, etc.
         """
-        total_revenue = sales_data['price'].sum()
-        total_orders = sales_data['order_id'].nunique()
-        avg_order_value = sales_data.groupby('order_id')['price'].sum().mean()
+        total_revenue, total_orders, avg_order_value, total_items = self._revenue_totals(sales_data)
         
         metrics = {
             'total_revenue': total_revenue,
             'total_orders': total_orders,
             'avg_order_value': avg_order_value,
-            'total_items_sold': len(sales_data)
+            'total_items_sold': total_items
         }
         
         if comparison_data is not None:
-            prev_revenue = comparison_data['price'].sum()
-            prev_orders = comparison_data['order_id'].nunique()
-            prev_aov = comparison_data.groupby('order_id')['price'].sum().mean()
+            prev_revenue, prev_orders, prev_aov, _ = self._revenue_totals(comparison_data)
             
             metrics.update({
                 'revenue_growth_rate': ((total_revenue - prev_revenue) / prev_revenue) * 100,
@@ -65,7 +404,8 @@ class EcommerceMetrics:
             
         return metrics
     
-    def calculate_monthly_trends(self, sales_data: pd.DataFrame) -> pd.DataFrame:
+    @_memoized
+    def calculate_monthly_trends(self, sales_data: Frame) -> pd.DataFrame:
         """
         Calculate month-over-month growth trends.
         
@@ -75,24 +415,23 @@ class EcommerceMetrics:
         Returns:
             pd.DataFrame: Monthly trends with growth rates
         """
-        monthly_revenue = sales_data.groupby('month')['price'].sum()
-        monthly_orders = sales_data.groupby('month')['order_id'].nunique()
-        monthly_aov = sales_data.groupby(['month', 'order_id'])['price'].sum().groupby('month').mean()
-        
-        trends = pd.DataFrame({
-            'month': monthly_revenue.index,
-            'revenue': monthly_revenue.values,
-            'orders': monthly_orders.values,
-            'avg_order_value': monthly_aov.values
-        })
-        
-        trends['revenue_growth'] = trends['revenue'].pct_change() * 100
-        trends['order_growth'] = trends['orders'].pct_change() * 100
-        trends['aov_growth'] = trends['avg_order_value'].pct_change() * 100
+        # One pass to per-order totals, then a small groupby over those for every monthly figure
+        if _is_lazy(sales_data):
+            order_totals, = _materialize(sales_data.groupby(['month', 'order_id'], sort=False, observed=True)['price'].sum())
+        else:
+            order_totals = self._order_summary(sales_data)
+        trends = order_totals.groupby(level='month', sort=True).agg(
+            revenue='sum', orders='size', avg_order_value='mean'
+        ).reset_index()
+        
+        trends['revenue_growth'] = _pct_change(trends['revenue'].to_numpy())
+        trends['order_growth'] = _pct_change(trends['orders'].to_numpy())
+        trends['aov_growth'] = _pct_change(trends['avg_order_value'].to_numpy())
         
         return trends
     
-    def analyze_product_performance(self, product_sales_data: pd.DataFrame) -> Dict:
+    @_memoized
+    def analyze_product_performance(self, product_sales_data: Frame) -> Dict:
         """
         Analyze product category performance.
         
@@ -102,22 +441,31 @@ class EcommerceMetrics:
         Returns:
             Dict: Product performance metrics
         """
-        category_revenue = product_sales_data.groupby('product_category_name')['price'].sum().sort_values(ascending=False)
-        category_orders = product_sales_data.groupby('product_category_name')['price'].count().sort_values(ascending=False)
-        category_aov = product_sales_data.groupby('product_category_name')['price'].mean().sort_values(ascending=False)
+        product_sales_data = self._to_arrow(product_sales_data, ['price'])
+        product_sales_data = _as_category(product_sales_data, 'product_category_name')
+        
+        # All three aggregations share one grouping of price
+        grouped = product_sales_data.groupby('product_category_name', sort=False, observed=True)['price']
+        engine = _engine_kwargs(product_sales_data)
+        revenue, orders, avg_order_value = _materialize(
+            grouped.sum(**engine), grouped.count(), grouped.mean(**engine)
+        )
+        # Group in first-seen order, then list categories by label as a sorted groupby does
+        category_performance = pd.DataFrame({
+            'revenue': revenue,
+            'orders': orders,
+            'avg_order_value': avg_order_value
+        }).sort_index()
         
         return {
-            'top_categories_by_revenue': category_revenue.head(10).to_dict(),
-            'top_categories_by_orders': category_orders.head(10).to_dict(),
-            'top_categories_by_aov': category_aov.head(10).to_dict(),
-            'category_performance': pd.DataFrame({
-                'revenue': category_revenue,
-                'orders': category_orders,
-                'avg_order_value': category_aov
-            })
+            'top_categories_by_revenue': _top_k(category_performance['revenue']),
+            'top_categories_by_orders': _top_k(category_performance['orders']),
+            'top_categories_by_aov': _top_k(category_performance['avg_order_value']),
+            'category_performance': category_performance
         }
     
-    def analyze_geographic_performance(self, geographic_data: pd.DataFrame) -> Dict:
+    @_memoized
+    def analyze_geographic_performance(self, geographic_data: Frame) -> Dict:
         """
         Analyze sales performance by geographic location.
         
@@ -127,22 +475,38 @@ class EcommerceMetrics:
         Returns:
             Dict: Geographic performance metrics
         """
-        state_revenue = geographic_data.groupby('customer_state')['price'].sum().sort_values(ascending=False)
-        state_orders = geographic_data.groupby('customer_state')['customer_id'].nunique().sort_values(ascending=False)
-        state_aov = geographic_data.groupby('customer_state')['price'].mean().sort_values(ascending=False)
+        geographic_data = self._to_arrow(geographic_data, ['price', 'customer_id'])
+        geographic_data = _as_category(geographic_data, 'customer_state')
+        
+        # Revenue, distinct customers and AOV share one grouping of customer_state
+        grouped = geographic_data.groupby('customer_state', sort=False, observed=True)
+        engine = _engine_kwargs(geographic_data)
+        if _is_lazy(geographic_data):
+            revenue, customers, avg_order_value = _materialize(
+                grouped['price'].sum(**engine), grouped['customer_id'].nunique(), grouped['price'].mean(**engine)
+            )
+        else:
+            revenue = grouped['price'].sum(**engine)
+            avg_order_value = grouped['price'].mean(**engine)
+            states = geographic_data['customer_state'].cat
+            distinct = _nunique_per_code(states.codes.to_numpy(), len(states.categories), geographic_data['customer_id'])
+            customers = pd.Series(distinct[revenue.index.codes], index=revenue.index)
+        # Group in first-seen order, then list states by label as a sorted groupby does
+        geographic_summary = pd.DataFrame({
+            'revenue': revenue,
+            'customers': customers,
+            'avg_order_value': avg_order_value
+        }).sort_index()
         
         return {
-            'top_states_by_revenue': state_revenue.head(10).to_dict(),
-            'top_states_by_customers': state_orders.head(10).to_dict(),
-            'top_states_by_aov': state_aov.head(10).to_dict(),
-            'geographic_summary': pd.DataFrame({
-                'revenue': state_revenue,
-                'customers': state_orders,
-                'avg_order_value': state_aov
-            })
+            'top_states_by_revenue': _top_k(geographic_summary['revenue']),
+            'top_states_by_customers': _top_k(geographic_summary['customers']),
+            'top_states_by_aov': _top_k(geographic_summary['avg_order_value']),
+            'geographic_summary': geographic_summary
         }
     
-    def analyze_customer_experience(self, review_data: pd.DataFrame) -> Dict:
+    @_memoized
+    def analyze_customer_experience(self, review_data: Frame) -> Dict:
         """
         Analyze customer experience metrics including delivery and satisfaction.
         
@@ -152,31 +516,63 @@ class EcommerceMetrics:
         Returns:
             Dict: Customer experience metrics
         """
-        # Overall satisfaction metrics
-        avg_rating = review_data['review_score'].mean()
-        rating_distribution = review_data['review_score'].value_counts(normalize=True).sort_index()
+        # Only two narrow columns are needed, so lazy inputs are pulled into memory up front
+        if _is_lazy(review_data):
+            review_data, = _materialize(review_data[['review_score', 'delivery_days']])
+        
+        score_dtype = review_data['review_score'].dtype
+        scores = review_data['review_score'].to_numpy(dtype='float64', na_value=np.nan)
+        days = review_data['delivery_days'].to_numpy(dtype='float64', na_value=np.nan)
+        has_score = ~np.isnan(scores)
+        has_days = ~np.isnan(days)
+        
+        # Review scores are small integer ratings (1-5), so bincount over the score itself
+        # replaces hashing; per-score delivery sums come from the same codes as weights
+        score_codes = scores[has_score].astype('int64')
+        rating_counts = np.bincount(score_codes)
+        timed = has_days[has_score]
+        days_counts = np.bincount(score_codes[timed], minlength=rating_counts.size)
+        days_sums = np.bincount(score_codes[timed], weights=days[has_score][timed], minlength=rating_counts.size)
+        observed_scores = np.flatnonzero(rating_counts)
+        score_labels = observed_scores.astype('float64') if score_dtype.kind == 'f' else observed_scores
         
-        # Delivery performance
-        avg_delivery_days = review_data['delivery_days'].mean()
-        delivery_by_rating = review_data.groupby('review_score')['delivery_days'].mean()
-        
-        # Categorize delivery speed and analyze satisfaction
-        review_data_copy = review_data.copy()
-        review_data_copy['delivery_category'] = review_data_copy['delivery_days'].apply(
-            lambda x: '1-3 days' if x <= 3 else '4-7 days' if x <= 7 else '8+ days'
-        )
-        satisfaction_by_delivery = review_data_copy.groupby('delivery_category')['review_score'].mean()
+        # Overall satisfaction metrics
+        rated_total = rating_counts.sum()
+        avg_rating = (observed_scores * rating_counts[observed_scores]).sum() / rated_total if rated_total else np.nan
+        rating_distribution = rating_counts[observed_scores] / max(rated_total, 1)
+        
+        # Delivery performance (unscored rows still count towards the overall average)
+        avg_delivery_days = days[has_days].mean() if has_days.any() else np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delivery_by_rating = days_sums[observed_scores] / days_counts[observed_scores]
+        
+        # Categorize delivery speed into int8 codes (no copy of review_data), then count per code
+        speed_codes = _delivery_speed(days).codes
+        binned = speed_codes >= 0
+        speed_counts = np.bincount(speed_codes[binned], minlength=len(DELIVERY_SPEED_LABELS))
+        rated = binned & has_score
+        rated_counts = np.bincount(speed_codes[rated], minlength=len(DELIVERY_SPEED_LABELS))
+        rated_sums = np.bincount(speed_codes[rated], weights=scores[rated], minlength=len(DELIVERY_SPEED_LABELS))
+        observed_speeds = np.flatnonzero(speed_counts)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            satisfaction_by_delivery = rated_sums[observed_speeds] / rated_counts[observed_speeds]
+        
+        # Most common observed speed first, as value_counts orders it (empty input gives {})
+        speed_order = observed_speeds[np.argsort(-speed_counts[observed_speeds], kind='stable')]
+        speed_labels = np.array(DELIVERY_SPEED_LABELS, dtype=object)
+        speed_shares = speed_counts[speed_order] / speed_counts.sum() if speed_order.size else speed_counts[:0]
         
         return {
             'avg_rating': avg_rating,
-            'rating_distribution': rating_distribution.to_dict(),
+            'rating_distribution': dict(zip(score_labels.tolist(), rating_distribution.tolist())),
             'avg_delivery_days': avg_delivery_days,
-            'delivery_by_rating': delivery_by_rating.to_dict(),
-            'satisfaction_by_delivery_speed': satisfaction_by_delivery.to_dict(),
-            'delivery_speed_distribution': review_data_copy['delivery_category'].value_counts(normalize=True).to_dict()
+            'delivery_by_rating': dict(zip(score_labels.tolist(), delivery_by_rating.tolist())),
+            'satisfaction_by_delivery_speed': dict(zip(speed_labels[observed_speeds], satisfaction_by_delivery.tolist())),
+            'delivery_speed_distribution': dict(zip(speed_labels[speed_order], speed_shares.tolist()))
         }
     
-    def calculate_order_fulfillment_metrics(self, orders_data: pd.DataFrame) -> Dict:
+    @_memoized
+    def calculate_order_fulfillment_metrics(self, orders_data: Frame) -> Dict:
         """
         Calculate order fulfillment and operational metrics.
         
@@ -186,7 +582,21 @@ class EcommerceMetrics:
         Returns:
             Dict: Fulfillment metrics
         """
-        status_distribution = orders_data['order_status'].value_counts(normalize=True)
+        orders_data = _as_category(orders_data, 'order_status')
+        if _is_lazy(orders_data):
+            status_distribution, = _materialize(orders_data['order_status'].value_counts(normalize=True))
+        else:
+            # Handful of known statuses: bincount the category codes instead of hash-counting labels
+            statuses = orders_data['order_status'].cat
+            codes = statuses.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(statuses.categories))
+            # Like value_counts, only statuses that occur are listed; no orders gives an empty distribution
+            observed = counts > 0
+            status_distribution = pd.Series(
+                counts[observed] / counts.sum() if observed.any() else np.array([], dtype='float64'),
+                index=statuses.categories[observed].astype(object)
+            )
+            status_distribution = status_distribution.sort_values(ascending=False, kind='stable')
         
         return {
             'fulfillment_rate': status_distribution.get('delivered', 0),
@@ -196,6 +606,42 @@ class EcommerceMetrics:
             'status_distribution': status_distribution.to_dict()
         }
     
+    def run_all(self, sales_data: Frame,
+                product_sales_data: Frame,
+                geographic_data: Frame,
+                review_data: Frame,
+                orders_data: Frame,
+                comparison_data: Optional[Frame] = None,
+                max_workers: Optional[int] = None) -> Dict:
+        """
+        Calculate all independent metric groups concurrently on a thread pool.
+        
+        Args:
+            sales_data (pd.DataFrame): Current period sales data
+            product_sales_data (pd.DataFrame): Sales data with product categories
+            geographic_data (pd.DataFrame): Sales data with geographic information
+            review_data (pd.DataFrame): Sales data with review scores and delivery info
+            orders_data (pd.DataFrame): Orders data with status information
+            comparison_data (pd.DataFrame, optional): Previous period for comparison
+            max_workers (int, optional): Thread pool size (defaults to one per metric group)
+            
+        Returns:
+            Dict: Results keyed by 'revenue', 'trends', 'products', 'geographic', 'experience', 'fulfillment'
+        """
+        # pandas' groupby kernels release the GIL, so the reductions overlap across threads
+        tasks = {
+            'revenue': (self.calculate_revenue_metrics, sales_data, comparison_data),
+            'trends': (self.calculate_monthly_trends, sales_data),
+            'products': (self.analyze_product_performance, product_sales_data),
+            'geographic': (self.analyze_geographic_performance, geographic_data),
+            'experience': (self.analyze_customer_experience, review_data),
+            'fulfillment': (self.calculate_order_fulfillment_metrics, orders_data)
+        }
+        
+        with ThreadPoolExecutor(max_workers=max_workers or len(tasks)) as pool:
+            futures = {name: pool.submit(*task) for name, task in tasks.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
     def create_revenue_trend_chart(self, trends_data: pd.DataFrame, 
                                   title_suffix: str = "") -> plt.Figure:
         """
@@ -221,11 +667,11 @@ class EcommerceMetrics:
         ax.grid(True, alpha=0.3)
         
         # Format y-axis to show currency
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+        ax.yaxis.set_major_formatter(StrMethodFormatter('${x:,.0f}'))
         
-        # Add value labels on points
-        for i, v in enumerate(trends_data['revenue']):
-            ax.annotate(f'${v:,.0f}', (trends_data['month'].iloc[i], v), 
+        # Add value labels on points (lines have no bar_label equivalent)
+        for month, v in zip(trends_data['month'].to_numpy(), trends_data['revenue'].to_numpy()):
+            ax.annotate(f'${v:,.0f}', (month, v), 
                        textcoords="offset points", xytext=(0,10), ha='center')
         
         plt.tight_layout()
@@ -257,15 +703,13 @@ class EcommerceMetrics:
         ax.set_xlabel('Revenue ($)', fontsize=12)
         ax.set_ylabel('Product Category', fontsize=12)
         ax.set_yticks(range(len(categories)))
-        ax.set_yticklabels([cat.replace('_', ' ').title() for cat in categories])
+        ax.set_yticklabels([_display_label(cat) for cat in categories])
         
         # Format x-axis
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+        ax.xaxis.set_major_formatter(StrMethodFormatter('${x:,.0f}'))
         
-        # Add value labels on bars
-        for i, v in enumerate(revenues):
-            ax.text(v + max(revenues)*0.01, i, f'${v:,.0f}', 
-                   va='center', fontsize=10)
+        # Add value labels on bars (pre-formatted: {}-style fmt needs matplotlib 3.7)
+        ax.bar_label(bars, labels=[f'${revenue:,.0f}' for revenue in revenues], padding=3, fontsize=10)
         
         plt.tight_layout()
         return fig
@@ -280,26 +724,23 @@ class EcommerceMetrics:
             title_suffix (str): Additional text for chart title
             
         Returns:
-            px.Figure: Geographic heatmap
-        """
-        # Reset index to get state as column
-        geo_data = geographic_summary.reset_index()
-        
-        # Create choropleth map
-        fig = px.choropleth(
-            geo_data,
-            locations='customer_state',
-            color='revenue',
-            locationmode='USA-states',
-            scope='usa',
-            title=f'Revenue by State {title_suffix}',
-            color_continuous_scale='Reds',
-            labels={'revenue': 'Revenue ($)', 'customer_state': 'State'}
-        )
-        
-        fig.update_layout(
-            title_font_size=16,
-            geo=dict(showframe=False, showcoastlines=True)
+            go.Figure: Geographic heatmap
+        """
+        # Create choropleth map straight from the summary's index and revenue arrays
+        fig = go.Figure(
+            go.Choropleth(
+                locations=geographic_summary.index.to_numpy(),
+                z=geographic_summary['revenue'].to_numpy(),
+                locationmode='USA-states',
+                colorscale='Reds',
+                colorbar=dict(title='Revenue ($)'),
+                hovertemplate='State=%{location}<br>Revenue ($)=%{z}<extra></extra>'
+            ),
+            layout=dict(
+                title=f'Revenue by State {title_suffix}',
+                title_font_size=16,
+                geo=dict(scope='usa', showframe=False, showcoastlines=True)
+            )
         )
         
         return fig
@@ -331,15 +772,14 @@ class EcommerceMetrics:
         delivery_speeds = list(experience_metrics['satisfaction_by_delivery_speed'].keys())
         satisfaction_scores = list(experience_metrics['satisfaction_by_delivery_speed'].values())
         
-        ax2.bar(delivery_speeds, satisfaction_scores, color='#d62728')
+        speed_bars = ax2.bar(delivery_speeds, satisfaction_scores, color='#d62728')
         ax2.set_title('Average Rating by Delivery Speed', fontsize=14, fontweight='bold')
         ax2.set_xlabel('Delivery Speed', fontsize=12)
         ax2.set_ylabel('Average Review Score', fontsize=12)
         ax2.set_ylim(0, 5)
         
-        # Add value labels
-        for i, v in enumerate(satisfaction_scores):
-            ax2.text(i, v + 0.05, f'{v:.2f}', ha='center', va='bottom')
+        # Add value labels (pre-formatted: {}-style fmt needs matplotlib 3.7)
+        ax2.bar_label(speed_bars, labels=[f'{score:.2f}' for score in satisfaction_scores], padding=2)
         
         plt.suptitle(f'Customer Experience Analysis {title_suffix}', 
                     fontsize=16, fontweight='bold')
@@ -367,7 +807,7 @@ class EcommerceMetrics:
         
         for status, proportion in fulfillment_metrics['status_distribution'].items():
             if proportion > 0.01:  # Only show statuses with >1% share
-                labels.append(status.replace('_', ' ').title())
+                labels.append(_display_label(status))
                 sizes.append(proportion * 100)
         
         wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%', 
@@ -458,7 +898,7 @@ class EcommerceMetrics:
         top_performers = summary['top_performers']
         print(f"\nTOP PERFORMERS:")
         if top_performers['top_product_category']:
-            print(f"  • Leading Product Category: {top_performers['top_product_category'].replace('_', ' ').title()}")
+            print(f"  • Leading Product Category: {_display_label(top_performers['top_product_category'])}")
         if top_performers['top_state']:
             print(f"  • Top Revenue State: {top_performers['top_state']}")
         
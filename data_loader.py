@@ -7,11 +7,67 @@ and provides filtered datasets based on configurable time periods.
 """
 
 import pandas as pd
+import numpy as np
 import os
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 import warnings
 warnings.filterwarnings('ignore')
 
+# Cached frames may be handed out as shallow copies only under copy-on-write (always on
+# from pandas 3.0, opt-in on 2.x); otherwise a caller's in-place edit would reach the cache
+COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True
+
+# Timestamps are ISO 8601 with fractional seconds ("2023-04-24 12:18:14.590086"); an explicit
+# format keeps pd.to_datetime on its C fast path instead of per-element dateutil inference
+DATE_FORMAT = 'ISO8601'
+
+ORDERS_DATE_COLUMNS = [
+    'order_purchase_timestamp',
+    'order_approved_at', 
+    'order_delivered_carrier_date',
+    'order_delivered_customer_date',
+    'order_estimated_delivery_date'
+]
+REVIEWS_DATE_COLUMNS = ['review_creation_date', 'review_answer_timestamp']
+
+# Source file of each dataset, and the timestamp columns parsed while reading it
+CSV_FILES = {
+    'orders': 'orders_dataset.csv',
+    'order_items': 'order_items_dataset.csv',
+    'products': 'products_dataset.csv',
+    'customers': 'customers_dataset.csv',
+    'reviews': 'order_reviews_dataset.csv'
+}
+DATE_COLUMNS = {'orders': ORDERS_DATE_COLUMNS, 'reviews': REVIEWS_DATE_COLUMNS}
+
+# Delivery speed buckets: (-inf, 3], (3, 7], (7, inf)
+DELIVERY_SPEED_BINS = [-np.inf, 3, 7, np.inf]
+DELIVERY_SPEED_LABELS = ['1-3 days', '4-7 days', '8+ days']
+
+# Order item columns carried into sales data
+ORDER_ITEM_COLUMNS = ('order_id', 'order_item_id', 'product_id', 'price', 'freight_value')
+
+# Only the columns the loader and its consumers use are read (in file order), with compact
+# dtypes for low-cardinality labels and small integers
+USECOLS = {
+    'orders_dataset.csv': [
+        'order_id', 'customer_id', 'order_status', 'order_purchase_timestamp', 'order_approved_at',
+        'order_delivered_carrier_date', 'order_delivered_customer_date', 'order_estimated_delivery_date'
+    ],
+    'order_items_dataset.csv': ['order_id', 'order_item_id', 'product_id', 'price', 'freight_value'],
+    'products_dataset.csv': ['product_id', 'product_category_name'],
+    'customers_dataset.csv': ['customer_id', 'customer_city', 'customer_state'],
+    'order_reviews_dataset.csv': ['order_id', 'review_score', 'review_creation_date', 'review_answer_timestamp']
+}
+DTYPES = {
+    'orders_dataset.csv': {'order_status': 'category'},
+    'order_items_dataset.csv': {'order_item_id': 'int16'},
+    'products_dataset.csv': {'product_category_name': 'category'},
+    'customers_dataset.csv': {'customer_city': 'category', 'customer_state': 'category'},
+    'order_reviews_dataset.csv': {'review_score': 'int8'}
+}
+
 class EcommerceDataLoader:
     """
     A class to handle loading and preprocessing of e-commerce datasets.
@@ -21,19 +77,44 @@ class EcommerceDataLoader:
     by date ranges, and prepare analysis-ready datasets.
     """
     
-    def __init__(self, data_path: str = "ecommerce_data/"):
+    def __init__(self, 
+                 data_path: str = "ecommerce_data/", 
+                 dtype_backend: Optional[str] = None,
+                 chunk_size: Optional[int] = None,
+                 parquet_cache: bool = False):
         """
         Initialize the data loader.
         
         Args:
             data_path (str): Path to the directory containing CSV files
+            dtype_backend (str, optional): 'pyarrow' to keep non-key columns in Arrow buffers
+                (passed to pd.read_csv); None keeps NumPy-backed frames
+            chunk_size (int, optional): Read each CSV in chunks of this many rows to bound
+                peak parsing memory; None reads every file in one pass
+            parquet_cache (bool): Save the processed datasets as Parquet under
+                data_path/.cache and reload from there while no source CSV is newer
         """
         self.data_path = data_path
+        self.dtype_backend = dtype_backend
+        self.chunk_size = chunk_size
+        self.parquet_cache = parquet_cache
+        self._cache_path = os.path.join(self.data_path, '.cache')
         self.orders = None
         self.order_items = None
         self.products = None
         self.customers = None
         self.reviews = None
+        # Shared categories of each ID key, set by _factorize_keys
+        self._key_categories = {}
+        # Lookup tables indexed by their unique primary key, built once at load time
+        self._orders_by_id = None
+        self._order_items_by_order = None
+        self._products_by_id = None
+        self._product_to_category = None
+        self._customers_by_id = None
+        self._reviews_by_id = None
+        # prepare_sales_data results keyed by (year, month, status)
+        self._sales_cache = {}
         self._validate_data_path()
     
     def _validate_data_path(self):
@@ -57,6 +138,59 @@ class EcommerceDataLoader:
         if missing_files:
             raise FileNotFoundError(f"Missing required files: {missing_files}")
         
+    def _read_csv(self, filename: str, date_columns: Optional[List[str]] = None, **kwargs) -> pd.DataFrame:
+        """
+        Read a CSV file from the data path with the multi-threaded PyArrow parser.
+        
+        Only the file's USECOLS are read, with its DTYPES applied, and date
+        columns are parsed to datetime64 by the reader itself, so no
+        intermediate string column is materialized; frames are returned
+        NumPy-backed so downstream vectorized code keeps working on plain
+        NumPy buffers.
+        
+        Args:
+            filename (str): CSV file name inside the data path
+            date_columns (List[str], optional): Timestamp columns to parse (missing ones are skipped)
+            **kwargs: Extra keyword arguments passed to pd.read_csv
+            
+        Returns:
+            pd.DataFrame: Loaded dataset
+        """
+        path = os.path.join(self.data_path, filename)
+        
+        # Optional columns may be absent from a file; restrict every option to its actual header
+        header = pd.read_csv(path, nrows=0).columns
+        kwargs.setdefault('usecols', [col for col in USECOLS.get(filename, header) if col in header])
+        kwargs.setdefault('dtype', {col: dtype for col, dtype in DTYPES.get(filename, {}).items() if col in header})
+        if date_columns:
+            kwargs['parse_dates'] = [col for col in date_columns if col in header]
+            kwargs['date_format'] = DATE_FORMAT
+        if self.dtype_backend is not None:
+            kwargs.setdefault('dtype_backend', self.dtype_backend)
+        if self.chunk_size:
+            # The PyArrow engine has no chunked reader; the C parser streams the file
+            return self._concat_chunks(list(pd.read_csv(path, chunksize=self.chunk_size, **kwargs)))
+        return pd.read_csv(path, engine='pyarrow', **kwargs)
+    
+    @staticmethod
+    def _concat_chunks(parts: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate CSV chunks into one frame, keeping categorical columns categorical.
+        
+        Each chunk infers its own categories, and pd.concat falls back to object dtype
+        when they differ, so categorical columns are rebuilt from the union of the chunks.
+        
+        Args:
+            parts (List[pd.DataFrame]): Chunks in file order
+            
+        Returns:
+            pd.DataFrame: Combined dataset with a fresh RangeIndex
+        """
+        frame = pd.concat(parts, ignore_index=True)
+        for col in parts[0].select_dtypes('category').columns:
+            frame[col] = pd.api.types.union_categoricals([part[col] for part in parts])
+        return frame
+    
     def load_all_datasets(self) -> Dict[str, pd.DataFrame]:
         """
         Load all CSV datasets into memory.
@@ -66,24 +200,15 @@ class EcommerceDataLoader:
         """
         print("Loading all datasets...")
         
-        # Load orders dataset
-        self.orders = pd.read_csv(os.path.join(self.data_path, 'orders_dataset.csv'))
-        self._process_orders_data()
-        
-        # Load order items dataset
-        self.order_items = pd.read_csv(os.path.join(self.data_path, 'order_items_dataset.csv'))
-        
-        # Load products dataset  
-        self.products = pd.read_csv(os.path.join(self.data_path, 'products_dataset.csv'))
-        
-        # Load customers dataset
-        self.customers = pd.read_csv(os.path.join(self.data_path, 'customers_dataset.csv'))
-        
-        # Load reviews dataset
-        self.reviews = pd.read_csv(os.path.join(self.data_path, 'order_reviews_dataset.csv'))
-        self._process_reviews_data()
+        self._load_or_build()
+        self._build_key_indexes()
+        self.reset_cache()
         
         print("All datasets loaded successfully!")
+        return self._datasets()
+    
+    def _datasets(self) -> Dict[str, pd.DataFrame]:
+        """Map each dataset name to its loaded DataFrame."""
         return {
             'orders': self.orders,
             'order_items': self.order_items,
@@ -92,40 +217,216 @@ class EcommerceDataLoader:
             'reviews': self.reviews
         }
     
+    def _load_or_build(self):
+        """
+        Load the processed datasets from the Parquet cache, or parse the CSVs.
+        
+        With parquet_cache enabled, a fresh cache skips CSV parsing, date
+        conversion and key factorization entirely; otherwise the datasets are
+        built from the CSVs and, if caching is enabled, written to the cache.
+        """
+        if self.parquet_cache and self._read_parquet_cache():
+            return
+        
+        # Parse the five files concurrently (the readers release the GIL); processing
+        # stays serial once every frame is in
+        with ThreadPoolExecutor(max_workers=len(CSV_FILES)) as executor:
+            futures = {
+                name: executor.submit(self._read_csv, filename, date_columns=DATE_COLUMNS.get(name))
+                for name, filename in CSV_FILES.items()
+            }
+            for name, future in futures.items():
+                setattr(self, name, future.result())
+        
+        self._process_orders_data()
+        self._process_reviews_data()
+        
+        self._factorize_keys()
+        if self.parquet_cache:
+            self._write_parquet_cache()
+    
+    def _parquet_cache_files(self) -> Dict[str, str]:
+        """Map each dataset name to its Parquet cache file."""
+        return {name: os.path.join(self._cache_path, f"{name}.parquet") for name in self._datasets()}
+    
+    def _read_parquet_cache(self) -> bool:
+        """
+        Load the datasets from the Parquet cache if it is newer than every source CSV.
+        
+        Parquet stores each table's categories on its own, so ID columns are
+        re-cast to the shared key categories saved in keys.npz, keeping joins
+        between tables on matching codes.
+        
+        Returns:
+            bool: True if the datasets were loaded from the cache
+        """
+        cache_files = self._parquet_cache_files()
+        keys_file = os.path.join(self._cache_path, 'keys.npz')
+        if not all(os.path.exists(path) for path in [*cache_files.values(), keys_file]):
+            return False
+        
+        built_at = min(os.path.getmtime(path) for path in [*cache_files.values(), keys_file])
+        sources = [os.path.join(self.data_path, file) for file in CSV_FILES.values()]
+        if any(os.path.getmtime(path) > built_at for path in sources):
+            return False
+        
+        with np.load(keys_file) as keys:
+            if str(keys['dtype_backend']) != str(self.dtype_backend):
+                return False
+            self._key_categories = {key: keys[key] for key in ('order_id', 'customer_id', 'product_id')}
+        
+        for name, path in cache_files.items():
+            setattr(self, name, pd.read_parquet(path))
+        for key, tables in self._key_tables().items():
+            key_dtype = pd.CategoricalDtype(self._key_categories[key])
+            for table in tables:
+                table[key] = table[key].astype(key_dtype)
+        return True
+    
+    def _write_parquet_cache(self):
+        """Write the processed datasets and shared key categories to the Parquet cache."""
+        os.makedirs(self._cache_path, exist_ok=True)
+        for name, path in self._parquet_cache_files().items():
+            getattr(self, name).to_parquet(path, compression='zstd')
+        np.savez(
+            os.path.join(self._cache_path, 'keys.npz'),
+            dtype_backend=np.array(str(self.dtype_backend)),
+            **{key: np.asarray(categories, dtype=str) for key, categories in self._key_categories.items()}
+        )
+    
     def _process_orders_data(self):
         """Process and clean orders data."""
-        # Convert timestamps to datetime
-        date_columns = [
-            'order_purchase_timestamp',
-            'order_approved_at', 
-            'order_delivered_carrier_date',
-            'order_delivered_customer_date',
-            'order_estimated_delivery_date'
-        ]
+        self._coerce_unparsed_dates(self.orders, ORDERS_DATE_COLUMNS)
+        
+        # Extract year and month from purchase timestamp via month-resolution datetimes
+        ts = self.orders['order_purchase_timestamp'].to_numpy()
+        months = ts.astype('datetime64[M]').view('i8')
+        missing = np.isnat(ts)
+        year = (1970 + months // 12).astype('int16')
+        month = (1 + months % 12).astype('int8')
+        if missing.any():
+            year[missing] = 0
+            month[missing] = 0
+            year = pd.arrays.IntegerArray(year, missing)
+            month = pd.arrays.IntegerArray(month, missing)
+        self.orders['year'] = year
+        self.orders['month'] = month
+        
+        # Delivery time is an order-level attribute; compute it once here rather
+        # than on every merged order-items frame
+        self.orders['delivery_days'] = self._whole_days_between(
+            self.orders['order_purchase_timestamp'],
+            self.orders['order_delivered_customer_date']
+        )
+        self.orders['delivery_speed'] = self.categorize_delivery_speed_vec(self.orders['delivery_days'])
+    
+    @staticmethod
+    def _whole_days_between(start: pd.Series, end: pd.Series) -> pd.Series:
+        """
+        Whole days from start to end, floored like Timedelta.days, as nullable Int32.
         
-        for col in date_columns:
-            if col in self.orders.columns:
-                self.orders[col] = pd.to_datetime(self.orders[col], errors='coerce')
+        Works on the raw int64 tick counts of the timestamps, so no timedelta
+        intermediate is built and the result is half the width of int64/float64.
         
-        # Extract year and month from purchase timestamp
-        self.orders['year'] = self.orders['order_purchase_timestamp'].dt.year
-        self.orders['month'] = self.orders['order_purchase_timestamp'].dt.month
+        Args:
+            start (pd.Series): Start timestamps
+            end (pd.Series): End timestamps
+            
+        Returns:
+            pd.Series: Elapsed days, <NA> where either timestamp is NaT
+        """
+        end = end.astype(start.dtype)
+        start_ticks = start.to_numpy().view('i8')
+        end_ticks = end.to_numpy().view('i8')
+        unit = np.datetime_data(start.dtype)[0]
+        ticks_per_day = np.timedelta64(1, 'D') // np.timedelta64(1, unit)
+        
+        missing = start.isna().to_numpy() | end.isna().to_numpy()
+        days = np.floor_divide(end_ticks - start_ticks, ticks_per_day).astype('int32')
+        days[missing] = 0
+        return pd.Series(pd.arrays.IntegerArray(days, missing), index=start.index)
     
     def _process_reviews_data(self):
         """Process and clean reviews data."""
-        # Convert review timestamps to datetime
-        self.reviews['review_creation_date'] = pd.to_datetime(
-            self.reviews['review_creation_date'], errors='coerce'
-        )
-        if 'review_answer_timestamp' in self.reviews.columns:
-            self.reviews['review_answer_timestamp'] = pd.to_datetime(
-                self.reviews['review_answer_timestamp'], errors='coerce'
-            )
+        self._coerce_unparsed_dates(self.reviews, REVIEWS_DATE_COLUMNS)
+    
+    @staticmethod
+    def _coerce_unparsed_dates(df: pd.DataFrame, date_columns: List[str]):
+        """
+        Convert date columns the CSV reader left as text (malformed values) to datetime.
+        
+        Columns already parsed at read time are skipped, so clean files pay nothing here.
+        
+        Args:
+            df (pd.DataFrame): Dataset to fix in place
+            date_columns (List[str]): Expected timestamp columns
+        """
+        for col in date_columns:
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col], format=DATE_FORMAT, errors='coerce', cache=True)
         
+    def _factorize_keys(self):
+        """
+        Encode the ID columns as categoricals sharing one category set per key.
+        
+        Each ID string is stored once in the shared categories and every table
+        holds small integer codes into it, so joins and groupbys on the keys compare
+        integers; the values still read back as the original strings.
+        """
+        for key, tables in self._key_tables().items():
+            uniques = pd.unique(pd.concat([table[key] for table in tables], ignore_index=True).dropna())
+            self._key_categories[key] = uniques
+            key_dtype = pd.CategoricalDtype(uniques)
+            for table in tables:
+                table[key] = table[key].astype(key_dtype)
+    
+    def _key_tables(self) -> Dict[str, List[pd.DataFrame]]:
+        """Map each ID key to the loaded tables that carry it."""
+        return {
+            'order_id': [self.orders, self.order_items, self.reviews],
+            'customer_id': [self.orders, self.customers],
+            'product_id': [self.products, self.order_items]
+        }
+    
+    def _build_key_indexes(self):
+        """
+        Index orders, products, customers and reviews by their keys for repeated joins.
+        
+        The public frames keep their key columns; these private copies hold only the
+        columns joined onto sales data, so every join reuses one prebuilt index instead
+        of hashing the key again per merge. Orders are sorted by key and order items are
+        kept in a private copy sorted the same way, so the sales join runs over two
+        monotonic keys and is a linear merge rather than a hash join.
+        """
+        self._orders_by_id = self.orders.set_index('order_id').sort_index()
+        self._order_items_by_order = self.order_items[list(ORDER_ITEM_COLUMNS)].sort_values('order_id', kind='stable')
+        self._products_by_id = self.products.set_index('product_id')[['product_category_name']]
+        self._product_to_category = self._products_by_id['product_category_name']
+        self._customers_by_id = self.customers.set_index('customer_id')[['customer_state', 'customer_city']]
+        self._reviews_by_id = self.reviews.set_index('order_id')[['review_score', 'review_creation_date']].sort_index()
+    
+    @staticmethod
+    def _cached_copy(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Copy of a cached frame that callers can modify without touching the cache.
+        
+        Args:
+            frame (pd.DataFrame): Frame held in the sales cache
+            
+        Returns:
+            pd.DataFrame: Shallow copy under copy-on-write, deep copy otherwise
+        """
+        return frame.copy(deep=not COPY_ON_WRITE)
+    
+    def reset_cache(self):
+        """Drop cached prepare_sales_data results (call after modifying the loaded datasets)."""
+        self._sales_cache.clear()
+    
     def prepare_sales_data(self, 
                           year: Optional[int] = None, 
                           month: Optional[int] = None,
-                          status: str = 'delivered') -> pd.DataFrame:
+                          status: str = 'delivered',
+                          use_cache: bool = True) -> pd.DataFrame:
         """
         Prepare sales data by merging order items and orders, with optional filtering.
         
@@ -133,6 +434,7 @@ class EcommerceDataLoader:
             year (int, optional): Filter by specific year
             month (int, optional): Filter by specific month  
             status (str): Order status to filter by (default: 'delivered')
+            use_cache (bool): Reuse the result of an earlier call with the same filters
             
         Returns:
             pd.DataFrame: Merged and filtered sales data
@@ -140,36 +442,51 @@ class EcommerceDataLoader:
         if self.orders is None or self.order_items is None:
             raise ValueError("Datasets must be loaded first. Call load_all_datasets()")
         
-        # Merge order items with orders
-        sales_data = pd.merge(
-            left=self.order_items[['order_id', 'order_item_id', 'product_id', 'price', 'freight_value']],
-            right=self.orders[[
-                'order_id', 'order_status', 'order_purchase_timestamp', 
-                'order_delivered_customer_date', 'year', 'month', 'customer_id'
-            ]],
-            on='order_id',
-            how='inner'
-        )
+        # The get_sales_with_* helpers each start from the same filtered merge
+        cache_key = (year, month, status)
+        if use_cache and cache_key in self._sales_cache:
+            return self._cached_copy(self._sales_cache[cache_key])
+        
+        order_columns = [
+            'order_status', 'order_purchase_timestamp', 
+            'order_delivered_customer_date', 'year', 'month', 'customer_id'
+        ]
+        # Delivery speed is only meaningful for delivered orders
+        if status == 'delivered':
+            order_columns.extend(['delivery_days', 'delivery_speed'])
         
-        # Filter by order status
+        # Filter orders before the merge so the join only materializes rows that are kept;
+        # the conditions are combined into one mask so orders are indexed only once
+        orders = self._orders_by_id
+        mask = np.ones(len(orders), dtype=bool)
+        
+        # Filter by order status, comparing category codes rather than strings
         if status:
-            sales_data = sales_data[sales_data['order_status'] == status].copy()
+            statuses = orders['order_status'].cat.categories
+            status_code = statuses.get_loc(status) if status in statuses else -2
+            mask &= orders['order_status'].cat.codes.to_numpy() == status_code
         
         # Filter by year if specified
         if year is not None:
-            sales_data = sales_data[sales_data['year'] == year].copy()
+            mask &= orders['year'].eq(year).to_numpy(dtype=bool, na_value=False)
         
         # Filter by month if specified  
         if month is not None:
-            sales_data = sales_data[sales_data['month'] == month].copy()
+            mask &= orders['month'].eq(month).to_numpy(dtype=bool, na_value=False)
         
-        # Calculate delivery speed for delivered orders
-        if status == 'delivered':
-            sales_data['delivery_days'] = (
-                sales_data['order_delivered_customer_date'] - 
-                sales_data['order_purchase_timestamp']
-            ).dt.days
+        orders = orders.loc[mask, order_columns]
         
+        # Merge order items with the selected orders
+        sales_data = self._order_items_by_order.join(
+            orders,
+            on='order_id',
+            how='inner',
+            validate='m:1'
+        )
+        
+        if use_cache:
+            self._sales_cache[cache_key] = sales_data
+            return self._cached_copy(sales_data)
         return sales_data
     
     def get_product_category_data(self, sales_data: pd.DataFrame) -> pd.DataFrame:
@@ -185,11 +502,22 @@ class EcommerceDataLoader:
         if self.products is None:
             raise ValueError("Products dataset not loaded.")
             
-        return pd.merge(
-            left=self.products[['product_id', 'product_category_name']],
-            right=sales_data[['product_id', 'price']],
-            on='product_id'
-        )
+        # A Series lookup only probes the product keys; no joined frame is built
+        categories = sales_data['product_id'].map(self._product_to_category)
+        product_sales = pd.DataFrame({
+            'product_id': sales_data['product_id'],
+            'product_category_name': categories,
+            'price': sales_data['price']
+        })
+        
+        # Keep the inner-join semantics: drop items whose product is not in the catalogue
+        if self._product_to_category.hasnans:
+            known = sales_data['product_id'].isin(self._product_to_category.index)
+        else:
+            known = categories.notna()
+        if not known.all():
+            product_sales = product_sales[known]
+        return product_sales.reset_index(drop=True)
     
     def get_geographic_data(self, sales_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -205,13 +533,11 @@ class EcommerceDataLoader:
             raise ValueError("Customers dataset not loaded.")
             
         # Merge with customer data to get geographic info
-        sales_with_customers = pd.merge(
-            left=sales_data[['order_id', 'customer_id', 'price']],
-            right=self.customers[['customer_id', 'customer_state', 'customer_city']],
-            on='customer_id'
+        sales_with_customers = sales_data[['order_id', 'customer_id', 'price']].join(
+            self._customers_by_id, on='customer_id', how='inner', validate='m:1'
         )
         
-        return sales_with_customers
+        return sales_with_customers.reset_index(drop=True)
     
     def get_review_data(self, sales_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -226,12 +552,10 @@ class EcommerceDataLoader:
         if self.reviews is None:
             raise ValueError("Reviews dataset not loaded.")
             
-        return pd.merge(
-            left=sales_data,
-            right=self.reviews[['order_id', 'review_score']],
-            on='order_id',
-            how='left'
-        )
+        # Left join keeps sales rows in order, like the merge it replaces, without rehashing reviews
+        return sales_data.join(
+            self._reviews_by_id[['review_score']], on='order_id', how='left'
+        ).reset_index(drop=True)
     
     def categorize_delivery_speed(self, days: int) -> str:
         """
@@ -243,12 +567,59 @@ class EcommerceDataLoader:
         Returns:
             str: Delivery speed category
         """
-        if days <= 3:
-            return '1-3 days'
-        elif days <= 7:
-            return '4-7 days'
-        else:
-            return '8+ days'
+        # Scalar twin of categorize_delivery_speed_vec; a plain loop stays cheaper than pd.cut for one value
+        for upper, label in zip(DELIVERY_SPEED_BINS[1:], DELIVERY_SPEED_LABELS):
+            if days <= upper:
+                return label
+        return DELIVERY_SPEED_LABELS[-1]
+    
+    def categorize_delivery_speed_vec(self, days: pd.Series) -> pd.Series:
+        """
+        Categorize delivery speed into bins for a whole column at once.
+        
+        Args:
+            days (pd.Series): Delivery days per row (NaN for undelivered orders)
+            
+        Returns:
+            pd.Series: Categorical delivery speed labels, NaN where days is missing
+        """
+        return pd.cut(days, bins=DELIVERY_SPEED_BINS, labels=DELIVERY_SPEED_LABELS)
+    
+    def get_sales_wide(self, 
+                       year: Optional[int] = None, 
+                       month: Optional[int] = None,
+                       use_cache: bool = True) -> pd.DataFrame:
+        """
+        Get sales data with product, customer and review information in one frame.
+        
+        The get_sales_with_* helpers are column slices of this frame, so an analysis
+        that needs all three runs the sales merge and each lookup join only once.
+        
+        Args:
+            year (int, optional): Filter by specific year
+            month (int, optional): Filter by specific month
+            use_cache (bool): Reuse the result of an earlier call with the same filters
+            
+        Returns:
+            pd.DataFrame: Sales data with categories, customer location and review scores
+        """
+        cache_key = (year, month, 'delivered', 'wide')
+        if use_cache and cache_key in self._sales_cache:
+            return self._cached_copy(self._sales_cache[cache_key])
+        
+        sales_data = self.prepare_sales_data(year=year, month=month, use_cache=use_cache)
+        sales_wide = (
+            sales_data
+            .join(self._products_by_id, on='product_id', how='left', validate='m:1')
+            .join(self._customers_by_id, on='customer_id', how='left', validate='m:1')
+            .join(self._reviews_by_id, on='order_id', how='left')
+            .reset_index(drop=True)
+        )
+        
+        if use_cache:
+            self._sales_cache[cache_key] = sales_wide
+            return self._cached_copy(sales_wide)
+        return sales_wide
     
     def get_sales_with_products(self, 
                                year: Optional[int] = None, 
@@ -263,17 +634,19 @@ class EcommerceDataLoader:
         Returns:
             pd.DataFrame: Sales data with product categories
         """
+        # With at most one review per order the wide frame has exactly one row per item
+        if self._reviews_by_id.index.is_unique:
+            extra_columns = [*self._customers_by_id.columns, *self._reviews_by_id.columns]
+            return self.get_sales_wide(year=year, month=month).drop(columns=extra_columns)
+        
         sales_data = self.prepare_sales_data(year=year, month=month)
         
         # Merge with products to get category information
-        sales_with_products = pd.merge(
-            left=sales_data,
-            right=self.products[['product_id', 'product_category_name']],
-            on='product_id',
-            how='left'
+        sales_with_products = sales_data.join(
+            self._products_by_id, on='product_id', how='left', validate='m:1'
         )
         
-        return sales_with_products
+        return sales_with_products.reset_index(drop=True)
     
     def get_sales_with_customers(self, 
                                 year: Optional[int] = None, 
@@ -288,17 +661,19 @@ class EcommerceDataLoader:
         Returns:
             pd.DataFrame: Sales data with customer location
         """
+        # With at most one review per order the wide frame has exactly one row per item
+        if self._reviews_by_id.index.is_unique:
+            extra_columns = [*self._products_by_id.columns, *self._reviews_by_id.columns]
+            return self.get_sales_wide(year=year, month=month).drop(columns=extra_columns)
+        
         sales_data = self.prepare_sales_data(year=year, month=month)
         
         # Merge with customers to get location data
-        sales_with_customers = pd.merge(
-            left=sales_data,
-            right=self.customers[['customer_id', 'customer_state', 'customer_city']],
-            on='customer_id',
-            how='left'
+        sales_with_customers = sales_data.join(
+            self._customers_by_id, on='customer_id', how='left', validate='m:1'
         )
         
-        return sales_with_customers
+        return sales_with_customers.reset_index(drop=True)
     
     def get_sales_with_reviews(self, 
                               year: Optional[int] = None, 
@@ -313,17 +688,25 @@ class EcommerceDataLoader:
         Returns:
             pd.DataFrame: Sales data with review scores
         """
-        sales_data = self.prepare_sales_data(year=year, month=month)
-        
-        # Merge with reviews
-        sales_with_reviews = pd.merge(
-            left=sales_data,
-            right=self.reviews[['order_id', 'review_score', 'review_creation_date']],
-            on='order_id',
-            how='left'
-        )
+        # Product and customer joins are m:1, so the wide frame's rows match a reviews-only merge
+        extra_columns = [*self._products_by_id.columns, *self._customers_by_id.columns]
+        return self.get_sales_wide(year=year, month=month).drop(columns=extra_columns)
+    
+    @staticmethod
+    def _category_counts(values: pd.Series) -> pd.Series:
+        """
+        Count the rows holding each category of a categorical column in one pass over its codes.
         
-        return sales_with_reviews
+        Args:
+            values (pd.Series): Categorical column
+            
+        Returns:
+            pd.Series: Row count per category (zero for unused ones), indexed by category
+        """
+        codes = values.cat.codes.to_numpy()
+        categories = values.cat.categories
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        return pd.Series(counts, index=categories, name='count')
     
     def get_dataset_summary(self) -> Dict[str, Any]:
         """
@@ -335,19 +718,25 @@ class EcommerceDataLoader:
         if self.orders is None:
             raise ValueError("Datasets must be loaded first. Call load_all_datasets()")
         
+        # Categorical columns are summarized from one bincount of their codes and review
+        # scores from one bincount of the values; counts, distinct totals and the average
+        # are all read off those arrays instead of rescanning the column per statistic
+        statuses = self._category_counts(self.orders['order_status'])
+        scores = np.bincount(self.reviews['review_score'].dropna().to_numpy(dtype='int64'))
+        score_values = np.flatnonzero(scores)
+        purchases = self.orders['order_purchase_timestamp']
+        categories = self.products['product_category_name'].unique()
+        
         summary = {
             'orders': {
                 'total_records': len(self.orders),
-                'date_range': (
-                    self.orders['order_purchase_timestamp'].min(),
-                    self.orders['order_purchase_timestamp'].max()
-                ),
-                'unique_customers': self.orders['customer_id'].nunique(),
-                'order_statuses': self.orders['order_status'].value_counts().to_dict()
+                'date_range': (purchases.min(), purchases.max()),
+                'unique_customers': int(np.count_nonzero(self._category_counts(self.orders['customer_id']))),
+                'order_statuses': statuses[statuses > 0].sort_values(ascending=False, kind='stable').to_dict()
             },
             'order_items': {
                 'total_records': len(self.order_items),
-                'unique_products': self.order_items['product_id'].nunique(),
+                'unique_products': int(np.count_nonzero(self._category_counts(self.order_items['product_id']))),
                 'price_range': (
                     self.order_items['price'].min(),
                     self.order_items['price'].max()
@@ -355,18 +744,18 @@ class EcommerceDataLoader:
             },
             'products': {
                 'total_records': len(self.products),
-                'unique_categories': self.products['product_category_name'].nunique(),
-                'categories': self.products['product_category_name'].unique().tolist()
+                'unique_categories': int(pd.notna(categories).sum()),
+                'categories': categories.tolist()
             },
             'customers': {
                 'total_records': len(self.customers),
-                'unique_states': self.customers['customer_state'].nunique(),
-                'unique_cities': self.customers['customer_city'].nunique()
+                'unique_states': int(np.count_nonzero(self._category_counts(self.customers['customer_state']))),
+                'unique_cities': int(np.count_nonzero(self._category_counts(self.customers['customer_city'])))
             },
             'reviews': {
                 'total_records': len(self.reviews),
-                'score_distribution': self.reviews['review_score'].value_counts().sort_index().to_dict(),
-                'average_score': self.reviews['review_score'].mean()
+                'score_distribution': dict(zip(score_values.tolist(), scores[score_values].tolist())),
+                'average_score': np.float64((score_values * scores[score_values]).sum() / scores.sum())
             }
         }
         
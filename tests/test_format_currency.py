@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import format_currency, vectorized_format_currency
+
+
+class VectorizedFormatCurrencyTest(unittest.TestCase):
+    """vectorized_format_currency must produce exactly the strings of format_currency."""
+    
+    def assert_matches_scalar(self, values):
+        expected = [format_currency(value) for value in values]
+        self.assertEqual(vectorized_format_currency(values).tolist(), expected)
+    
+    def test_half_values(self):
+        # Halfway points in each branch, where np.round's half-to-even used to diverge
+        self.assert_matches_scalar([
+            0.5, 1.5, 2.5, 999.5,
+            1_500, 2_500, 10_500, 999_499.5,
+            1_050_000, 1_150_000, 2_450_000, 2_550_000, 12_350_000
+        ])
+    
+    def test_branch_boundaries(self):
+        self.assert_matches_scalar([0, 999, 999.4, 1_000, 999_999, 1_000_000, 1_000_000.5])
+    
+    def test_random_amounts(self):
+        rng = np.random.default_rng(0)
+        self.assert_matches_scalar(np.round(rng.uniform(0, 5_000_000, 2_000), 2).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()